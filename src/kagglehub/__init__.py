@@ -1,19 +1,63 @@
 __version__ = "0.3.4"
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 import kagglehub.logger  # configures the library logger.
-from kagglehub import colab_cache_resolver, http_resolver, kaggle_cache_resolver, registry
 from kagglehub.auth import login, whoami
-from kagglehub.competition import competition_download
-from kagglehub.datasets import dataset_download, dataset_upload
-from kagglehub.models import model_download, model_upload
 
-registry.model_resolver.add_implementation(http_resolver.ModelHttpResolver())
-registry.model_resolver.add_implementation(kaggle_cache_resolver.ModelKaggleCacheResolver())
-registry.model_resolver.add_implementation(colab_cache_resolver.ModelColabCacheResolver())
+if TYPE_CHECKING:
+    from kagglehub.competition import competition_download
+    from kagglehub.datasets import dataset_download, dataset_upload
+    from kagglehub.models import model_download, model_upload
+
+__all__ = [
+    "competition_download",
+    "dataset_download",
+    "dataset_upload",
+    "login",
+    "model_download",
+    "model_upload",
+    "whoami",
+]
+
+# The download & upload entry points (and the resolvers they pull in) are only imported on first access.
+_LAZY_ATTRIBUTES = {
+    "competition_download": "kagglehub.competition",
+    "dataset_download": "kagglehub.datasets",
+    "dataset_upload": "kagglehub.datasets",
+    "model_download": "kagglehub.models",
+    "model_upload": "kagglehub.models",
+}
+
+# Submodules which used to be imported by `import kagglehub`, they stay reachable as attributes, e.g.
+# `kagglehub.registry.model_resolver.add_implementation(...)`.
+_LAZY_SUBMODULES = {
+    "colab_cache_resolver",
+    "competition",
+    "datasets",
+    "datasets_helpers",
+    "gcs_upload",
+    "http_resolver",
+    "kaggle_cache_resolver",
+    "models",
+    "models_helpers",
+    "registry",
+    "resolver",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value  # Cache it so `__getattr__` isn't called again for this name.
+        return value
+    if name in _LAZY_SUBMODULES:
+        # Importing a submodule also binds it as an attribute of this package.
+        return importlib.import_module(f"{__name__}.{name}")
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
-registry.dataset_resolver.add_implementation(http_resolver.DatasetHttpResolver())
-registry.dataset_resolver.add_implementation(kaggle_cache_resolver.DatasetKaggleCacheResolver())
-registry.dataset_resolver.add_implementation(colab_cache_resolver.DatasetColabCacheResolver())
 
-registry.competition_resolver.add_implementation(http_resolver.CompetitionHttpResolver())
-registry.competition_resolver.add_implementation(kaggle_cache_resolver.CompetitionKaggleCacheResolver())
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | _LAZY_SUBMODULES)
@@ -1,8 +1,11 @@
+import functools
 import hashlib
+import http.cookiejar
 import json
 import logging
 import os
 from datetime import datetime, timezone
+from http import HTTPStatus
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urljoin
@@ -10,8 +13,10 @@ from urllib.parse import urljoin
 import requests
 import requests.auth
 from packaging.version import parse
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 
 import kagglehub
 from kagglehub.cache import delete_from_cache, get_cached_archive_path
@@ -22,7 +27,7 @@ from kagglehub.env import (
     is_in_colab_notebook,
     is_in_kaggle_notebook,
     read_kaggle_build_date,
-    search_lib_in_call_stack,
+    search_libs_in_call_stack,
 )
 from kagglehub.exceptions import (
     BackendError,
@@ -46,6 +51,18 @@ DEFAULT_CONNECT_TIMEOUT = 5  # seconds
 DEFAULT_READ_TIMEOUT = 15  # seconds
 ACCEPT_RANGE_HTTP_HEADER = "Accept-Ranges"
 HTTP_STATUS_404 = 404
+# Connection pool settings for the session shared by all `KaggleApiV1Client` instances.
+# POOL_MAXSIZE is the number of connections kept per host, it must be at least the number of threads downloading or
+# uploading in parallel through the session (see `MAX_NUM_DOWNLOAD_WORKERS` and `MAX_UPLOAD_WORKERS`), otherwise
+# the extra connections are discarded instead of reused.
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+MAX_RETRIES = 3
+# Only retry once when establishing the connection fails, a timed out connect attempt already waited
+# DEFAULT_CONNECT_TIMEOUT seconds. Read errors are never retried, see `_get_session`.
+MAX_CONNECT_RETRIES = 1
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_FORCELIST = (HTTPStatus.BAD_GATEWAY, HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.GATEWAY_TIMEOUT)
 
 _CHECKSUM_MISMATCH_MSG_TEMPLATE = """\
 The X-Goog-Hash header indicated a MD5 checksum of:
@@ -66,11 +83,9 @@ def get_user_agent() -> str:
     """
     user_agents = [f"kagglehub/{kagglehub.__version__}"]
 
-    for keras_lib in ("keras_hub", "keras_nlp", "keras_cv", "keras"):
-        keras_info = search_lib_in_call_stack(keras_lib)
-        if keras_info is not None:
-            user_agents.append(keras_info)
-            break
+    keras_info = search_libs_in_call_stack(("keras_hub", "keras_nlp", "keras_cv", "keras"))
+    if keras_info is not None:
+        user_agents.append(keras_info)
 
     if is_in_kaggle_notebook():
         build_date = read_kaggle_build_date()
@@ -83,6 +98,43 @@ def get_user_agent() -> str:
     return " ".join(user_agents)
 
 
+@functools.cache
+def _get_session() -> requests.Session:
+    """Returns the session shared by all `KaggleApiV1Client` instances.
+
+    Reusing a single session keeps connections alive across requests (and threads) instead of paying for a new
+    TCP + TLS handshake on every call.
+    """
+    session = requests.Session()
+    # Like the module-level `requests.get`/`requests.post`, don't carry cookies over from one call to the next
+    # (e.g. after `login()` switched credentials).
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(
+            total=MAX_RETRIES,
+            connect=MAX_CONNECT_RETRIES,
+            # Re-raise read errors as is: a stalled request fails after DEFAULT_READ_TIMEOUT with a `ReadTimeout`.
+            read=False,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_FORCELIST,
+            # Don't let the server dictate (unbounded) sleeps, or retry statuses outside of RETRY_STATUS_FORCELIST.
+            respect_retry_after_header=False,
+            # Return the last response once retries are exhausted so `kaggle_api_raise_for_status` can handle it.
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+if hasattr(os, "register_at_fork"):  # Not available on Windows.
+    # A forked child must not share the parent's keep-alive sockets, it gets its own session on first use.
+    os.register_at_fork(after_in_child=_get_session.cache_clear)
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -107,7 +159,7 @@ class KaggleApiV1Client:
 
     def get(self, path: str, resource_handle: Optional[ResourceHandle] = None) -> dict:
         url = self._build_url(path)
-        with requests.get(
+        with _get_session().get(
             url,
             headers={"User-Agent": get_user_agent()},
             auth=self._get_auth(),
@@ -119,7 +171,7 @@ class KaggleApiV1Client:
 
     def post(self, path: str, data: dict) -> dict:
         url = self._build_url(path)
-        with requests.post(
+        with _get_session().post(
             url,
             headers={"User-Agent": get_user_agent()},
             json=data,
@@ -147,7 +199,7 @@ class KaggleApiV1Client:
         bool:  If downloading remote was necessary
         """
         url = self._build_url(path)
-        with requests.get(
+        with _get_session().get(
             url,
             headers={"User-Agent": get_user_agent()},
             stream=True,
@@ -177,7 +229,7 @@ class KaggleApiV1Client:
                 logger.info(f"Resuming download from {size_read} bytes ({total_size - size_read} bytes left)...")
 
                 # Send the request again with the 'Range' header.
-                with requests.get(
+                with _get_session().get(
                     response.url,  # URL after redirection
                     stream=True,
                     auth=self._get_auth(),
@@ -227,12 +279,12 @@ def _download_file(
 ) -> None:
     open_mode = "ab" if size_read > 0 else "wb"
     with tqdm(total=total_size, initial=size_read, unit="B", unit_scale=True, unit_divisor=1024) as progress_bar:
-        with open(out_file, open_mode) as f:
+        # Buffer writes in CHUNK_SIZE blocks: decoded (e.g. gzip) or chunked responses can yield much smaller chunks.
+        with open(out_file, open_mode, buffering=CHUNK_SIZE) as f:
             for chunk in response.iter_content(CHUNK_SIZE):
                 f.write(chunk)
                 if hash_object:
                     hash_object.update(chunk)
-                size_read = min(total_size, size_read + CHUNK_SIZE)
                 progress_bar.update(len(chunk))
 
 
@@ -2,6 +2,7 @@ import functools
 import inspect
 import logging
 import os
+from collections.abc import Sequence
 from importlib import metadata  # type: ignore
 from typing import Optional
 
@@ -40,28 +41,30 @@ def read_kaggle_build_date() -> str:
         return "unknown"
 
 
-def search_lib_in_call_stack(lib_name: str) -> Optional[str]:
-    """Search the call stack for a given library name and get its information.
+def search_libs_in_call_stack(lib_names: Sequence[str]) -> Optional[str]:
+    """Search the call stack for the given library names and get the information of the first one found.
 
     Args:
-        lib_name (str):
-            The name of the library to search for.
-            We use str.startswith so the lib_name must match the exact module name from beginning.
+        lib_names (Sequence[str]):
+            The names of the libraries to search for, in order of priority.
+            We use str.startswith so each lib_name must match the exact module name from beginning.
 
     Returns:
         str: A formatted string f"{lib_name}/{lib_version}" if found, otherwise None.
     """
-    for frame_info in inspect.stack():
+    # Walking the stack & resolving each frame's module is expensive, only do it once for all the libraries.
+    module_names = []
+    for frame_info in inspect.stack(context=0):
         module = inspect.getmodule(frame_info.frame)
         if module and hasattr(module, "__name__"):
-            module_name = module.__name__
-        else:
-            module_name = None
+            module_names.append(module.__name__)
 
-        if module_name is not None and module_name.startswith(lib_name):
-            try:
-                lib_version = metadata.version(lib_name)
-                return f"{lib_name}/{lib_version}"
-            except metadata.PackageNotFoundError:
-                continue
+    for lib_name in lib_names:
+        for module_name in module_names:
+            if module_name.startswith(lib_name):
+                try:
+                    lib_version = metadata.version(lib_name)
+                    return f"{lib_name}/{lib_version}"
+                except metadata.PackageNotFoundError:
+                    break  # Not installed as a package, try the next library.
     return None
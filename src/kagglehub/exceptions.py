@@ -5,6 +5,26 @@ import requests
 
 from kagglehub.handle import CompetitionHandle, ResourceHandle
 
+_PERMISSION_ERROR_MSG_TEMPLATE = """\
+{status_code} Client Error.
+
+You don't have permission to access resource at URL: {resource_url}
+Please make sure you are authenticated if you are trying to access a private resource or a resource \
+requiring consent."""
+
+_COMPETITION_PERMISSION_ERROR_MSG_TEMPLATE = """\
+{status_code} Client Error.
+
+You don't have permission to access resource at URL: {resource_url}
+Please make sure you are authenticated and have accepted the competition rules which can be found at this location: \
+{resource_url}/rules"""
+
+_NOT_FOUND_ERROR_MSG_TEMPLATE = """\
+{status_code} Client Error.
+
+Resource not found at URL: {resource_url}
+Please make sure you specified the correct resource identifiers."""
+
 
 class CredentialError(Exception):
     pass
@@ -61,29 +81,16 @@ def kaggle_api_raise_for_status(response: requests.Response, resource_handle: Op
         resource_url = resource_handle.to_url() if resource_handle else response.url
         if response.status_code in {HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN}:
             if isinstance(resource_handle, CompetitionHandle):
-                message = (
-                    f"{response.status_code} Client Error."
-                    "\n\n"
-                    f"You don't have permission to access resource at URL: {resource_url}"
-                    "\nPlease make sure you are authenticated and have accepted the competition rules which"
-                    f" can be found at this location: {resource_url}/rules"
+                message = _COMPETITION_PERMISSION_ERROR_MSG_TEMPLATE.format(
+                    status_code=response.status_code, resource_url=resource_url
                 )
             else:
-                message = (
-                    f"{response.status_code} Client Error."
-                    "\n\n"
-                    f"You don't have permission to access resource at URL: {resource_url}"
-                    "\nPlease make sure you are authenticated if you are trying to access a"
-                    " private resource or a resource requiring consent."
+                message = _PERMISSION_ERROR_MSG_TEMPLATE.format(
+                    status_code=response.status_code, resource_url=resource_url
                 )
 
         if response.status_code == HTTPStatus.NOT_FOUND:
-            message = (
-                f"{response.status_code} Client Error."
-                "\n\n"
-                f"Resource not found at URL: {resource_url}"
-                "\nPlease make sure you specified the correct resource identifiers."
-            )
+            message = _NOT_FOUND_ERROR_MSG_TEMPLATE.format(status_code=response.status_code, resource_url=resource_url)
 
         # Default handling
         raise KaggleApiHTTPError(message, response=response) from e
@@ -101,13 +108,7 @@ def colab_raise_for_status(response: requests.Response, resource_handle: Optiona
         resource_url = resource_handle.to_url() if resource_handle else response.url
 
         if response.status_code in {HTTPStatus.UNAUTHORIZED, HTTPStatus.FORBIDDEN}:
-            message = (
-                f"{response.status_code} Client Error."
-                "\n\n"
-                f"You don't have permission to access resource at URL: {resource_url}"
-                "\nPlease make sure you are authenticated if you are trying to access a private resource or a resource"
-                " requiring consent."
-            )
+            message = _PERMISSION_ERROR_MSG_TEMPLATE.format(status_code=response.status_code, resource_url=resource_url)
         # Default handling
         raise ColabHTTPError(message, response=response) from e
 
@@ -119,6 +120,7 @@ def process_post_response(response: dict[str, Any]) -> None:
     if not (200 <= response.get("code", 200) < 300):  # noqa: PLR2004
         error_message = response.get("message", "No error message provided")
         raise BackendError(error_message)
-    elif "error" in response and response["error"] != "":
-        error_code = int(response["errorCode"]) if "errorCode" in response else None
-        raise BackendError(response["error"], error_code)
+    error = response.get("error")
+    if error:
+        error_code = response.get("errorCode")
+        raise BackendError(error, int(error_code) if error_code is not None else None)
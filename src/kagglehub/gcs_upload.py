@@ -1,10 +1,10 @@
 import fnmatch
 import logging
 import os
-import pathlib
 import time
 import zipfile
 from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from tempfile import TemporaryDirectory
 from typing import Optional, Union
@@ -23,6 +23,8 @@ MAX_FILES_TO_UPLOAD = 50
 TEMP_ARCHIVE_FILE = "archive.zip"
 MAX_RETRIES = 5
 REQUEST_TIMEOUT = 600
+# Must not exceed `clients.POOL_MAXSIZE`.
+MAX_UPLOAD_WORKERS = 8
 
 
 class UploadDirectoryInfo:
@@ -83,11 +85,12 @@ def filtered_walk(*, base_dir: str, ignore_patterns: Sequence[str]) -> Iterable[
         Iterable[tuple[str, list[str], list[str]]]: (base_dir_path, list[dir_names], list[filtered_file_names])
     """
     for dir_path, dir_names, file_names in os.walk(base_dir):
-        dir_p = pathlib.Path(dir_path)
+        # Compute the relative dir path once, each file only needs to be joined to it.
+        rel_dir_path = os.path.relpath(dir_path, base_dir)
         filtered_files = []
         for file_name in file_names:
-            rel_file_p = (dir_p / file_name).relative_to(base_dir)
-            if not any(fnmatch.fnmatch(name=str(rel_file_p), pat=pat) for pat in ignore_patterns):
+            rel_file_path = file_name if rel_dir_path == os.curdir else os.path.join(rel_dir_path, file_name)
+            if not any(fnmatch.fnmatch(name=rel_file_path, pat=pat) for pat in ignore_patterns):
                 filtered_files.append(file_name)
         if filtered_files:
             yield (dir_path, dir_names, filtered_files)
@@ -118,12 +121,13 @@ def _check_uploaded_size(session_uri: str, file_size: int, backoff_factor: int =
     return 0  # Return 0 if all retries fail
 
 
-def _upload_blob(file_path: str, item_type: str) -> str:
+def _upload_blob(file_path: str, item_type: str, api_client: KaggleApiV1Client) -> str:
     """Uploads a file to a remote server as a blob and returns an upload token.
 
     Args:
         file_path: The path to the file to be uploaded.
         item_type : The type of the item associated with the file.
+        api_client: The client used to request the blob upload URL.
 
     Returns:
         A str token of uploaded blob.
@@ -135,7 +139,6 @@ def _upload_blob(file_path: str, item_type: str) -> str:
         "contentLength": file_size,
         "lastModifiedEpochSeconds": int(os.path.getmtime(file_path)),
     }
-    api_client = KaggleApiV1Client()
     response = api_client.post("/blobs/upload", data=data)
 
     # Validate response content
@@ -195,9 +198,15 @@ def upload_files_and_directories(
     item_type: str,
     quiet: bool = False,
 ) -> UploadDirectoryInfo:
+    # A single client (and its credentials lookup) is shared by all the file uploads.
+    api_client = KaggleApiV1Client()
+
+    # Walk the folder only once, the listing is reused below to zip or upload the files.
+    walk_results = list(filtered_walk(base_dir=folder, ignore_patterns=ignore_patterns))
+
     # Count the total number of files
     file_count = 0
-    for _, _, files in filtered_walk(base_dir=folder, ignore_patterns=ignore_patterns):
+    for _, _, files in walk_results:
         file_count += len(files)
 
     if file_count > MAX_FILES_TO_UPLOAD:
@@ -207,14 +216,14 @@ def upload_files_and_directories(
         with TemporaryDirectory() as temp_dir:
             zip_path = os.path.join(temp_dir, TEMP_ARCHIVE_FILE)
             with zipfile.ZipFile(zip_path, "w") as zipf:
-                for root, _, files in filtered_walk(base_dir=folder, ignore_patterns=ignore_patterns):
+                for root, _, files in walk_results:
                     for file in files:
                         file_path = os.path.join(root, file)
                         zipf.write(file_path, os.path.relpath(file_path, folder))
 
             tokens = [
                 token
-                for token in [_upload_file(file_path=zip_path, item_type=item_type, quiet=quiet)]
+                for token in [_upload_file(file_path=zip_path, item_type=item_type, quiet=quiet, api_client=api_client)]
                 if token is not None
             ]
             return UploadDirectoryInfo(name="archive", files=tokens)
@@ -222,11 +231,13 @@ def upload_files_and_directories(
     root_dict = UploadDirectoryInfo(name="root")
     if os.path.isfile(folder):
         # Directly upload the file if the path is a file
-        token = _upload_file(file_path=folder, item_type=item_type, quiet=quiet)
+        token = _upload_file(file_path=folder, item_type=item_type, quiet=quiet, api_client=api_client)
         if token:
             root_dict.files.append(token)
     else:
-        for root, _, files in filtered_walk(base_dir=folder, ignore_patterns=ignore_patterns):
+        # Build the directory tree first, then upload the files in parallel.
+        pending_uploads: list[tuple[str, UploadDirectoryInfo]] = []
+        for root, _, files in walk_results:
             # Path of the current folder relative to the base folder
             path = os.path.relpath(root, folder)
 
@@ -245,22 +256,43 @@ def upload_files_and_directories(
                         current_dict.directories.append(new_dir)
                         current_dict = new_dir
 
-            # Add file tokens to the current directory in the dictionary
             for file in files:
-                token = _upload_file(file_path=os.path.join(root, file), item_type=item_type, quiet=quiet)
-                if token:
-                    current_dict.files.append(token)
+                pending_uploads.append((os.path.join(root, file), current_dict))
+
+        pbar = tqdm(total=len(pending_uploads), desc=f"Uploading {len(pending_uploads)} files", disable=quiet)
+        with ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS) as executor, pbar:
+            futures = [
+                executor.submit(
+                    _upload_file, file_path=file_path, item_type=item_type, quiet=quiet, api_client=api_client
+                )
+                for file_path, _ in pending_uploads
+            ]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    pbar.update(1)
+            except BaseException:
+                # Stop at the first failure: uploads that haven't started are cancelled, running ones still complete.
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            upload_tokens = [future.result() for future in futures]
+
+        # Add file tokens to their directory in the dictionary, preserving the walk order.
+        for (_, directory), token in zip(pending_uploads, upload_tokens):
+            if token:
+                directory.files.append(token)
 
     return root_dict
 
 
-def _upload_file(file_path: str, *, quiet: bool, item_type: str) -> Optional[str]:
+def _upload_file(file_path: str, *, quiet: bool, item_type: str, api_client: KaggleApiV1Client) -> Optional[str]:
     """Helper function to upload a single file.
 
     Args:
         full_path: path to the file to upload
         quiet: suppress verbose output
         item_type: Type of the item that is being uploaded.
+        api_client: The client used to request the blob upload URL.
 
     Returns:
         A str token of uploaded file if successful, otherwise None.
@@ -274,7 +306,7 @@ def _upload_file(file_path: str, *, quiet: bool, item_type: str) -> Optional[str
         return None
 
     content_length = os.path.getsize(file_path)
-    token = _upload_blob(file_path, item_type)
+    token = _upload_blob(file_path, item_type, api_client)
     if not quiet:
         logger.info("Upload successful: " + file_path + " (" + File.get_size(content_length) + ")")
     return token
@@ -23,6 +23,8 @@ DATASET_CURRENT_VERSION_FIELD = "currentVersionNumber"
 
 MODEL_INSTANCE_VERSION_FIELD = "versionNumber"
 MAX_NUM_FILES_DIRECT_DOWNLOAD = 25
+# Never use more than 8 threads in parallel to download files. Must not exceed `clients.POOL_MAXSIZE`.
+MAX_NUM_DOWNLOAD_WORKERS = 8
 
 logger = logging.getLogger(__name__)
 
@@ -182,17 +184,21 @@ class ModelHttpResolver(Resolver[ModelHandle]):
                 # Delete the archive
                 os.remove(archive_path)
             else:
+                file_out_paths = {file: out_path + "/" + file for file in files}
+
+                # Create the (unique) intermediary directories once, before downloading in parallel.
+                for file_out_dir in {os.path.dirname(file_out_path) for file_out_path in file_out_paths.values()}:
+                    os.makedirs(file_out_dir, exist_ok=True)
+
                 # Download files individually in parallel
                 def _inner_download_file(file: str) -> None:
-                    file_out_path = out_path + "/" + file
-                    os.makedirs(os.path.dirname(file_out_path), exist_ok=True)
-                    api_client.download_file(url_path + "/" + file, file_out_path, h)
+                    api_client.download_file(url_path + "/" + file, file_out_paths[file], h)
 
                 thread_map(
                     _inner_download_file,
                     files,
                     desc=f"Downloading {len(files)} files",
-                    max_workers=8,  # Never use more than 8 threads in parallel to download files.
+                    max_workers=MAX_NUM_DOWNLOAD_WORKERS,
                 )
 
         mark_as_complete(h, path)
@@ -6,7 +6,7 @@ import requests
 
 # See https://cloud.google.com/storage/docs/xml-api/reference-headers#xgooghash
 GCS_HASH_HEADER = "x-goog-hash"
-COMPUTE_HASH_CHUNK_SIZE = 8192
+COMPUTE_HASH_CHUNK_SIZE = 1048576
 
 logger = logging.getLogger(__name__)
 
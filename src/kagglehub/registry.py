@@ -1,5 +1,7 @@
 from typing import Callable
 
+from kagglehub import colab_cache_resolver, http_resolver, kaggle_cache_resolver
+
 
 class MultiImplRegistry:
     """Utility class to inject multiple implementations of class.
@@ -31,3 +33,17 @@ class MultiImplRegistry:
 model_resolver = MultiImplRegistry("ModelResolver")
 dataset_resolver = MultiImplRegistry("DatasetResolver")
 competition_resolver = MultiImplRegistry("CompetitionResolver")
+
+
+# The default implementations are registered when this module is first imported, i.e. on first use of one of the
+# `*_download` functions, rather than on `import kagglehub`.
+model_resolver.add_implementation(http_resolver.ModelHttpResolver())
+model_resolver.add_implementation(kaggle_cache_resolver.ModelKaggleCacheResolver())
+model_resolver.add_implementation(colab_cache_resolver.ModelColabCacheResolver())
+
+dataset_resolver.add_implementation(http_resolver.DatasetHttpResolver())
+dataset_resolver.add_implementation(kaggle_cache_resolver.DatasetKaggleCacheResolver())
+dataset_resolver.add_implementation(colab_cache_resolver.DatasetColabCacheResolver())
+
+competition_resolver.add_implementation(http_resolver.CompetitionHttpResolver())
+competition_resolver.add_implementation(kaggle_cache_resolver.CompetitionKaggleCacheResolver())
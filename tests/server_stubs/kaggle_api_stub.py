@@ -1,6 +1,8 @@
 import hashlib
 import os
 import re
+import threading
+from dataclasses import dataclass
 
 from flask import Flask, Response, jsonify, request
 from flask.typing import ResponseReturnValue
@@ -11,6 +13,29 @@ from tests.utils import get_test_file_path
 app = Flask(__name__)
 
 
+@dataclass
+class SharedData:
+    flaky_request_count: int = 0
+
+
+shared_data: SharedData = SharedData()
+lock = threading.Lock()
+
+
+def _increment_flaky_request() -> int:
+    lock.acquire()
+    shared_data.flaky_request_count += 1
+    count = shared_data.flaky_request_count
+    lock.release()
+    return count
+
+
+def reset() -> None:
+    lock.acquire()
+    shared_data.flaky_request_count = 0
+    lock.release()
+
+
 @app.route("/", methods=["HEAD"])
 def head() -> ResponseReturnValue:
     return "", 200
@@ -74,3 +99,28 @@ def good() -> ResponseReturnValue:
             ),
             200,
         )
+
+
+@app.route("/api/v1/set-cookie", methods=["GET"])
+def set_cookie() -> ResponseReturnValue:
+    resp = jsonify({})
+    resp.set_cookie("session-cookie", "value")
+    return resp, 200
+
+
+@app.route("/api/v1/echo-cookies", methods=["GET"])
+def echo_cookies() -> ResponseReturnValue:
+    return jsonify(dict(request.cookies)), 200
+
+
+@app.route("/api/v1/flaky", methods=["GET"])
+def flaky() -> ResponseReturnValue:
+    # Fails with a transient error every other request.
+    if _increment_flaky_request() % 2 == 1:
+        return "", 503
+    return jsonify({"flaky": "ok"}), 200
+
+
+@app.route("/api/v1/unavailable", methods=["GET"])
+def unavailable() -> ResponseReturnValue:
+    return "", 503
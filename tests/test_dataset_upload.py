@@ -51,6 +51,19 @@ class TestDatasetUpload(BaseTestCase):
             self.assertEqual(len(stub.shared_data.files), 1)
             self.assertIn(TEMP_TEST_FILE, stub.shared_data.files)
 
+    def test_dataset_upload_multiple_files_in_nested_directories(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            expected_files = []
+            for dir_name in ["first", "second"]:
+                nested_dir = Path(temp_dir) / dir_name
+                nested_dir.mkdir()
+                for i in range(3):
+                    file_name = f"{dir_name}_{TEMP_TEST_FILE}_{i}"
+                    (nested_dir / file_name).touch()
+                    expected_files.append(file_name)
+            dataset_upload("jeward/newDataset", temp_dir, "dataset_type")
+            self.assertEqual(sorted(expected_files), sorted(stub.shared_data.files))
+
     def test_dataset_upload_with_too_many_files(self) -> None:
         with TemporaryDirectory() as temp_dir:
             # Create more than 50 temporary files in the directory
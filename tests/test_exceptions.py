@@ -0,0 +1,28 @@
+from kagglehub.exceptions import BackendError, process_post_response
+from tests.fixtures import BaseTestCase
+
+
+class TestProcessPostResponse(BaseTestCase):
+    def test_success_response_does_not_raise(self) -> None:
+        process_post_response({"code": 200})
+
+    def test_non_2xx_code_raises(self) -> None:
+        with self.assertRaises(BackendError) as cm:
+            process_post_response({"code": 403, "message": "Forbidden"})
+        self.assertEqual("Forbidden", str(cm.exception))
+        self.assertIsNone(cm.exception.error_code)
+
+    def test_null_error_does_not_raise(self) -> None:
+        process_post_response({"error": None})
+
+    def test_error_without_error_code(self) -> None:
+        with self.assertRaises(BackendError) as cm:
+            process_post_response({"error": "x", "errorCode": None})
+        self.assertEqual("x", str(cm.exception))
+        self.assertIsNone(cm.exception.error_code)
+
+    def test_error_with_error_code(self) -> None:
+        with self.assertRaises(BackendError) as cm:
+            process_post_response({"error": "x", "errorCode": "5"})
+        self.assertEqual("x", str(cm.exception))
+        self.assertEqual(5, cm.exception.error_code)
@@ -1,13 +1,28 @@
 """Test helper functions in kagglehub.
 """
 
+import os
 import pathlib
 import tempfile
+import threading
+import time
+from unittest.mock import patch
 
-from kagglehub.gcs_upload import filtered_walk, normalize_patterns
+from kagglehub.clients import KaggleApiV1Client
+from kagglehub.exceptions import BackendError
+from kagglehub.gcs_upload import UploadDirectoryInfo, filtered_walk, normalize_patterns, upload_files_and_directories
 from tests.fixtures import BaseTestCase
 
 
+def _to_tree(directory: UploadDirectoryInfo) -> dict:
+    # The walk order of sibling files & directories depends on the filesystem, compare them sorted.
+    return {
+        "name": directory.name,
+        "files": sorted(directory.files),
+        "directories": sorted((_to_tree(d) for d in directory.directories), key=lambda d: d["name"]),
+    }
+
+
 class TesModelsHelpers(BaseTestCase):
     def testnormalize_patterns(self) -> None:
         default_patterns = [".git/", ".cache/", ".gitignore"]
@@ -62,3 +77,59 @@ class TesModelsHelpers(BaseTestCase):
                 for file_name in file_names:
                     walked_files.append(pathlib.Path(dir_path) / file_name)
             self.assertEqual(set(walked_files), expected_files)
+
+    def test_upload_files_and_directories_keeps_tokens_in_their_directory(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_dir_p = pathlib.Path(tmp_dir)
+            (tmp_dir_p / "a" / "b").mkdir(parents=True)
+            (tmp_dir_p / "c").mkdir(parents=True)
+            for file_path in ["root.txt", "a/a1.txt", "a/a2.txt", "a/b/b.txt", "c/c1.txt", "c/c2.txt"]:
+                (tmp_dir_p / file_path).touch()
+
+            def fake_upload_blob(file_path: str, item_type: str, api_client: KaggleApiV1Client) -> str:  # noqa: ARG001
+                # Finish the uploads out of order to make sure tokens are matched by position, not completion.
+                time.sleep(0.01 * (len(file_path) % 3))
+                return "token-" + os.path.relpath(file_path, tmp_dir).replace(os.sep, "/")
+
+            with patch("kagglehub.gcs_upload._upload_blob", side_effect=fake_upload_blob):
+                root = upload_files_and_directories(tmp_dir, ignore_patterns=[], item_type="model", quiet=True)
+
+            expected = {
+                "name": "root",
+                "files": ["token-root.txt"],
+                "directories": [
+                    {
+                        "name": "a",
+                        "files": ["token-a/a1.txt", "token-a/a2.txt"],
+                        "directories": [{"name": "b", "files": ["token-a/b/b.txt"], "directories": []}],
+                    },
+                    {"name": "c", "files": ["token-c/c1.txt", "token-c/c2.txt"], "directories": []},
+                ],
+            }
+            self.assertEqual(expected, _to_tree(root))
+
+    def test_upload_files_and_directories_stops_at_first_failure(self) -> None:
+        num_files = 40
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for i in range(num_files):
+                (pathlib.Path(tmp_dir) / f"file_{i}.txt").touch()
+
+            lock = threading.Lock()
+            calls = []
+
+            def fake_upload_blob(file_path: str, item_type: str, api_client: KaggleApiV1Client) -> str:  # noqa: ARG001
+                with lock:
+                    calls.append(file_path)
+                    is_first_call = len(calls) == 1
+                if is_first_call:
+                    msg = "upload failed"
+                    raise BackendError(msg)
+                time.sleep(0.1)
+                return "token"
+
+            with patch("kagglehub.gcs_upload._upload_blob", side_effect=fake_upload_blob):
+                with self.assertRaises(BackendError):
+                    upload_files_and_directories(tmp_dir, ignore_patterns=[], item_type="model", quiet=True)
+
+            # Uploads which hadn't started when the first one failed are cancelled.
+            self.assertLess(len(calls), num_files)
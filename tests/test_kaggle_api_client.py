@@ -1,11 +1,12 @@
 import os
+import unittest
 from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
 
 import kagglehub
 from kagglehub import clients
 from kagglehub.clients import KaggleApiV1Client
-from kagglehub.exceptions import DataCorruptionError
+from kagglehub.exceptions import DataCorruptionError, KaggleApiHTTPError
 from tests.fixtures import BaseTestCase
 
 from .server_stubs import kaggle_api_stub as stub
@@ -13,6 +14,10 @@ from .server_stubs import serv
 
 
 class TestKaggleApiV1Client(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        stub.reset()
+
     @classmethod
     def setUpClass(cls):
         cls.server = serv.start_server(stub.app)
@@ -68,6 +73,54 @@ class TestKaggleApiV1Client(BaseTestCase):
             # Assert the corrupted file has been deleted.
             self.assertFalse(os.path.exists(out_file))
 
+    def test_clients_share_session(self) -> None:
+        session = clients._get_session()
+        with patch.object(session, "send", wraps=session.send) as mock_send:
+            KaggleApiV1Client().get("echo-cookies")
+            KaggleApiV1Client().get("echo-cookies")
+
+        self.assertEqual(2, mock_send.call_count)
+
+    def test_session_does_not_keep_cookies(self) -> None:
+        api_client = KaggleApiV1Client()
+        api_client.get("set-cookie")
+
+        self.assertEqual(0, len(clients._get_session().cookies))
+        self.assertEqual({}, api_client.get("echo-cookies"))
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork")
+    def test_forked_child_gets_new_session(self) -> None:
+        parent_session = clients._get_session()
+        pid = os.fork()
+        if pid == 0:  # Child process
+            exit_code = 1
+            try:
+                exit_code = 0 if clients._get_session() is not parent_session else 1
+            finally:
+                os._exit(exit_code)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(0, os.waitstatus_to_exitcode(status))
+        self.assertIs(parent_session, clients._get_session())
+
+    @patch.object(clients, "RETRY_BACKOFF_FACTOR", 0)
+    def test_get_retries_transient_errors(self) -> None:
+        clients._get_session.cache_clear()  # Rebuild the session without retry backoff.
+        self.addCleanup(clients._get_session.cache_clear)
+        api_client = KaggleApiV1Client()
+        self.assertEqual({"flaky": "ok"}, api_client.get("flaky"))
+        self.assertEqual(2, stub.shared_data.flaky_request_count)
+
+    @patch.object(clients, "RETRY_BACKOFF_FACTOR", 0)
+    def test_get_raises_after_retries_exhausted(self) -> None:
+        clients._get_session.cache_clear()  # Rebuild the session without retry backoff.
+        self.addCleanup(clients._get_session.cache_clear)
+        api_client = KaggleApiV1Client()
+        with self.assertRaises(KaggleApiHTTPError) as cm:
+            api_client.get("unavailable")
+
+        self.assertEqual(503, cm.exception.response.status_code)
+
     @patch.dict("os.environ", {})
     def test_get_user_agent(self) -> None:
         self.assertEqual(clients.get_user_agent(), f"kagglehub/{kagglehub.__version__}")
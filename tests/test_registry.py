@@ -1,3 +1,6 @@
+import os
+import subprocess
+import sys
 from typing import Any, Callable
 
 from kagglehub import registry
@@ -47,3 +50,19 @@ class RegistryTest(BaseTestCase):
         r.add_implementation(FakeImpl(lambda _: False, fail_fn))
 
         self.assertRaisesRegex(RuntimeError, r"Missing implementation", r, SOME_VALUE)
+
+    def test_registry_reachable_from_package_after_import(self) -> None:
+        # Run in a fresh interpreter, this test process has already imported all the kagglehub submodules.
+        code = (
+            "import kagglehub\n"
+            "print(len(kagglehub.registry.model_resolver._impls), kagglehub.http_resolver.__name__)"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+
+        self.assertEqual("3 kagglehub.http_resolver", result.stdout.strip())